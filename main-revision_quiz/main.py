@@ -1,24 +1,29 @@
-import difflib
+import atexit
+import functools
+import itertools
 import json
 import os
 import re
 import sys
 import unicodedata
+from dataclasses import dataclass
 from typing import Optional
 
-# rapidfuzz is an optional dependency that provides higher-quality fuzzy
-# matching for short text answers (it handles token ordering and small edits
-# more gracefully). If it's not installed the program will still run using
-# Python's built-in difflib.
+from rapidfuzz import fuzz, process
+
+# orjson is an optional, faster drop-in for reading and writing the JSON data
+# files. The standard library json module is used when it isn't installed.
 try:
-    from rapidfuzz import fuzz  # type: ignore
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
-    _HAS_RAPIDFUZZ = True
-except Exception:
-    # Keep a safe fallback so the rest of the code can check the flag and use
-    # difflib when necessary.
-    fuzz = None
-    _HAS_RAPIDFUZZ = False
+# ijson is optional: when installed, very large question banks are parsed
+# incrementally instead of being loaded in full.
+try:
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
 
 # -------------------------------
 # Project configuration
@@ -28,6 +33,19 @@ except Exception:
 QUESTIONS_DIR = "questions"
 PERFORMANCE_FILE = "performance.json"
 
+# Minimum rapidfuzz score (0..100) for a fuzzy match. Conservative, since
+# answers are short and small edits change the score quickly.
+FUZZY_THRESHOLD = 88.0
+
+# Write performance.json indented for manual inspection while debugging. Off
+# by default, since compact output is quicker to serialise and smaller on disk.
+PRETTY_PERFORMANCE_JSON = False
+
+# Question banks at least this size (in bytes) are streamed with ijson when it
+# is installed. Smaller banks, which is all of the bundled ones, are loaded in
+# full and cached, which is far cheaper for files of a few KB.
+STREAM_QUESTIONS_MIN_BYTES = 1024 * 1024
+
 # Supported qualification levels and the subjects available in the question
 # bank. These strings are used to construct filenames such as
 # 'ALevel_Computer_Science.json'.
@@ -65,15 +83,84 @@ def load_questions(level, subject):
     directory. If the file is missing an empty list is returned so the caller
     can handle the condition without exceptions during a demo.
     """
+    path = _question_path(level, subject)
+    if path is None:
+        return []
+    return _read_question_file(path)
+
+
+def _question_path(level, subject):
+    """Return the path of the question file, or None (with an error) if missing."""
     filename = f"{level}_{subject}.json"
     path = os.path.join(QUESTIONS_DIR, filename)
     if not os.path.exists(path):
         print(f"Error: {filename} not found in {QUESTIONS_DIR}")
-        return []
+        return None
+    return path
+
+
+@functools.lru_cache(maxsize=32)
+def _read_question_file(path):
+    """Parse a question bank file, caching the result per path.
+
+    Question banks don't change while the program runs, so revisiting a
+    subject reuses the already-parsed list instead of re-reading the file.
+    """
+    if orjson is not None:
+        with open(path, "rb") as file:
+            return orjson.loads(file.read())
     with open(path, "r") as file:
         return json.load(file)
 
 
+def iter_questions(level, subject):
+    """Yield the questions for the given level and subject one at a time.
+
+    Banks smaller than STREAM_QUESTIONS_MIN_BYTES come from the cached
+    load_questions list, so their prepared matchers are reused between
+    sessions. Larger banks are streamed with ijson when it is installed, so
+    the whole file never has to be held in memory at once.
+    """
+    path = _question_path(level, subject)
+    if path is None:
+        return
+    if ijson is None or os.path.getsize(path) < STREAM_QUESTIONS_MIN_BYTES:
+        yield from _read_question_file(path)
+        return
+    with open(path, "rb") as file:
+        yield from ijson.items(file, "item", use_float=True)
+
+
+@dataclass(slots=True)
+class Stats:
+    """Attempted/correct counts for one topic.
+
+    Stored on disk as {"attempted": ..., "correct": ...}; a slotted dataclass
+    is smaller and quicker to update than a dict on the quiz hot path.
+    """
+
+    attempted: int = 0
+    correct: int = 0
+
+
+def _stats_to_json(obj):
+    """json `default` hook that writes Stats in the on-disk dict format."""
+    if isinstance(obj, Stats):
+        return {"attempted": obj.attempted, "correct": obj.correct}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stats_from_json(data):
+    """Convert loaded performance data so each topic holds a Stats object."""
+    return {
+        key: {
+            topic: Stats(stats["attempted"], stats["correct"])
+            for topic, stats in topics.items()
+        }
+        for key, topics in data.items()
+    }
+
+
 def load_performance():
     """Read stored performance data from disk.
 
@@ -86,20 +173,77 @@ def load_performance():
     if not os.path.exists(PERFORMANCE_FILE):
         return {}
     try:
-        with open(PERFORMANCE_FILE, "r") as file:
-            content = file.read().strip()
-            if not content:
-                return {}
-            return json.loads(content)
-    except json.JSONDecodeError:
+        # Read raw bytes: both parsers accept them directly and ignore
+        # surrounding whitespace, so no decoded or stripped copy is needed.
+        with open(PERFORMANCE_FILE, "rb") as file:
+            content = file.read()
+        if not content or content.isspace():
+            return {}
+        if orjson is not None:
+            return _stats_from_json(orjson.loads(content))
+        return _stats_from_json(json.loads(content))
+    except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+        # orjson.JSONDecodeError is a subclass, so this covers both parsers.
+        # The other errors come from _stats_from_json when the file parses
+        # but doesn't have the expected {key: {topic: stats}} shape.
         print("Warning: performance.json is corrupted. Starting fresh.\n")
         return {}
 
 
 def save_performance(performance):
-    """Persist performance data as pretty JSON for easy inspection."""
+    """Persist performance data as JSON.
+
+    Output is compact unless PRETTY_PERFORMANCE_JSON is enabled, in which case
+    it is indented for easy inspection. orjson is used when installed; it
+    serialises the Stats dataclass as a dict natively.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if PRETTY_PERFORMANCE_JSON else 0
+        with open(PERFORMANCE_FILE, "wb") as file:
+            file.write(orjson.dumps(performance, option=option))
+        return
     with open(PERFORMANCE_FILE, "w") as file:
-        json.dump(performance, file, indent=4)
+        if PRETTY_PERFORMANCE_JSON:
+            json.dump(performance, file, indent=4, default=_stats_to_json)
+        else:
+            json.dump(
+                performance, file, separators=(",", ":"), default=_stats_to_json
+            )
+
+
+class PerformanceStore:
+    """Hold the parsed performance data for the lifetime of the program.
+
+    The file is read from disk the first time the data is requested and only
+    written back when it has been marked as changed, so repeated lookups and
+    saves don't re-read or rewrite an unchanged file.
+    """
+
+    def __init__(self):
+        self._data = None
+        self._dirty = False
+
+    def get(self):
+        """Return the performance data, loading it from disk on first use."""
+        if self._data is None:
+            self._data = load_performance()
+        return self._data
+
+    def mark_dirty(self):
+        """Record that the data has changed and needs to be saved."""
+        self._dirty = True
+
+    def flush(self):
+        """Write the data to disk if it has changed since the last save."""
+        if self._dirty:
+            save_performance(self._data)
+            self._dirty = False
+
+
+# Shared store used by the menus. Registered with atexit so progress is still
+# saved if the program exits part way through a session.
+performance_store = PerformanceStore()
+atexit.register(performance_store.flush)
 
 
 # -------------------------------
@@ -112,15 +256,20 @@ def choose_option(options, prompt, allow_back=False):
     straightforward to follow during marking/demonstration. If `allow_back` is
     True a 'Go back' option is included for nested menus.
     """
+    # Build the menu text once; it is rewritten in a single call on each retry.
+    lines = ["", prompt]
+    for i, option in enumerate(options, 1):
+        lines.append(f"{i}. {option.replace('_', ' ')}")
+    extra = 0
+    if allow_back:
+        extra = 1
+        lines.append(f"{len(options) + 1}. Go back")
+    lines.append(f"{len(options) + 1 + extra}. Exit")
+    menu = "\n".join(lines) + "\n"
+
     while True:
-        print("\n" + prompt)
-        for i, option in enumerate(options, 1):
-            print(f"{i}. {option.replace('_', ' ')}")
-        extra = 0
-        if allow_back:
-            extra = 1
-            print(f"{len(options) + 1}. Go back")
-        print(f"{len(options) + 1 + extra}. Exit")
+        sys.stdout.write(menu)
+        sys.stdout.flush()
 
         choice = input("Enter number: ").strip()
         if choice.isdigit():
@@ -137,230 +286,271 @@ def choose_option(options, prompt, allow_back=False):
 
 def get_accuracy(data):
     """Return the accuracy (correct/attempted) as a fraction 0..1."""
-    if data["attempted"] == 0:
+    if data.attempted == 0:
         return 0
-    return data["correct"] / data["attempted"]
+    return data.correct / data.attempted
 
 
 # -------------------------------
-# Quiz logic and answer matching
+# Answer normalisation helpers
 # -------------------------------
-def ask_question(question, performance, key):
-    """Ask a single question, accept flexible answers and update performance.
+# Patterns used by normalize_text, compiled once at import time rather than on
+# every comparison.
+_RE_NONALNUM = re.compile(r"[^0-9a-z\s]")
+_RE_WS = re.compile(r"\s+")
+# Typographic quotes mapped to their plain ASCII equivalents.
+_QUOTE_TABLE = str.maketrans({"’": "'", "‘": "'", "“": '"', "”": '"'})
+
+
+# Short answers ("A", "True", "3") repeat a lot across a question bank and a
+# session, so results are memoised. typed=True keeps equal values of different
+# types (1, 1.0, True) apart, since str() gives each a different result.
+@functools.lru_cache(maxsize=4096, typed=True)
+def normalize_text(s: str) -> str:
+    """Normalise a string to a lower, ascii-ish form suitable for comparison.
+
+    - Applies Unicode NFKC normalisation
+    - Converts to lowercase
+    - Replaces common typographic quotes
+    - Removes non-alphanumeric characters (except spaces)
+    - Collapses whitespace
+    """
+    if s is None:
+        return ""
+    s = str(s)
+    # Most typed answers are plain ASCII, for which NFKC and the quote
+    # replacements are no-ops, so only pay for them when needed.
+    if not s.isascii():
+        s = unicodedata.normalize("NFKC", s)
+        s = s.translate(_QUOTE_TABLE)
+    s = s.strip().lower()
+    s = _RE_NONALNUM.sub(" ", s)
+    s = _RE_WS.sub(" ", s).strip()
+    return s
 
-    The matching logic is intentionally forgiving to make revision sessions
-    smoother for students: it normalises case and punctuation, accepts small
-    word-number variants (e.g. 'three' vs '3'), handles option letters
-    ('A', 'a)') and applies a conservative fuzzy-match threshold for minor
-    typos or spelling differences.
 
-    For a larger system these helpers would be extracted to a utility module
-    with unit tests, but for the coursework project we keep them local and
-    readable within this function.
+def normalize_option(s: str) -> str:
+    """Extract a canonical token from short option-style answers.
+
+    Examples:
+      - "A.", "a)" -> "a"
+      - "1." -> "1"
+
+    This helps match student input for multiple-choice style answers.
+    """
+    s = normalize_text(s)
+    if not s:
+        return ""
+    parts = s.split()
+    first = parts[0]
+    # A single letter/digit, optionally followed by '.' or ')'. Checked by
+    # hand as the grammar is too small to be worth a regex.
+    if first[0].isalnum() and (
+        len(first) == 1 or (len(first) == 2 and first[1] in ".)")
+    ):
+        return first[0]
+    return s
+
+
+# small word->number mapping for common number-words (expandable)
+_WORD_NUMS = {
+    "zero": 0,
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+    "ten": 10,
+    "eleven": 11,
+    "twelve": 12,
+    "thirteen": 13,
+    "fourteen": 14,
+    "fifteen": 15,
+    "sixteen": 16,
+    "seventeen": 17,
+    "eighteen": 18,
+    "nineteen": 19,
+    "twenty": 20,
+    "thirty": 30,
+    "forty": 40,
+    "fifty": 50,
+    "sixty": 60,
+    "seventy": 70,
+    "eighty": 80,
+    "ninety": 90,
+}
+
+
+# Every supported spelled-out number ("zero" .. "ninety nine") mapped to its
+# value, built once so parsing is a single dictionary lookup.
+_WORD_NUM_FULL = {
+    **_WORD_NUMS,
+    **{
+        f"{tens_word} {ones_word}": tens + ones
+        for tens_word, tens in _WORD_NUMS.items()
+        if tens >= 20
+        for ones_word, ones in _WORD_NUMS.items()
+        if 1 <= ones < 10
+    },
+}
+
+
+def word_number_to_int(s: str) -> Optional[int]:
+    """Convert small spelled-out numbers (e.g. 'twenty one') to an int.
+
+    Returns None if the text cannot be parsed as a simple word-number.
     """
+    return _WORD_NUM_FULL.get(normalize_text(s))
 
-    # --- Local normalisation helpers ---
-    def normalize_text(s: str) -> str:
-        """Normalise a string to a lower, ascii-ish form suitable for comparison.
-
-        - Applies Unicode NFKC normalisation
-        - Converts to lowercase
-        - Replaces common typographic quotes
-        - Removes non-alphanumeric characters (except spaces)
-        - Collapses whitespace
-        """
-        if s is None:
-            return ""
-        s = str(s)
-        s = unicodedata.normalize("NFKC", s)
-        s = s.replace("’", "'").replace("‘", "'").replace("“", '"').replace("”", '"')
-        s = s.strip().lower()
-        s = re.sub(r"[^0-9a-z\s]", " ", s)
-        s = re.sub(r"\s+", " ", s).strip()
-        return s
-
-    def normalize_option(s: str) -> str:
-        """Extract a canonical token from short option-style answers.
-
-        Examples:
-          - "A.", "a)" -> "a"
-          - "1." -> "1"
-
-        This helps match student input for multiple-choice style answers.
-        """
-        s = normalize_text(s)
-        if not s:
-            return ""
-        parts = s.split()
-        first = parts[0]
-        m = re.match(r"^([a-zA-Z0-9])[\.\)]?$", first)
-        if m:
-            return m.group(1)
-        return s
-
-    # small word->number mapping for common number-words (expandable)
-    _WORD_NUMS = {
-        "zero": 0,
-        "one": 1,
-        "two": 2,
-        "three": 3,
-        "four": 4,
-        "five": 5,
-        "six": 6,
-        "seven": 7,
-        "eight": 8,
-        "nine": 9,
-        "ten": 10,
-        "eleven": 11,
-        "twelve": 12,
-        "thirteen": 13,
-        "fourteen": 14,
-        "fifteen": 15,
-        "sixteen": 16,
-        "seventeen": 17,
-        "eighteen": 18,
-        "nineteen": 19,
-        "twenty": 20,
-        "thirty": 30,
-        "forty": 40,
-        "fifty": 50,
-        "sixty": 60,
-        "seventy": 70,
-        "eighty": 80,
-        "ninety": 90,
-    }
 
-    def word_number_to_int(s: str) -> Optional[int]:
-        """Convert small spelled-out numbers (e.g. 'twenty one') to an int.
-
-        Returns None if the text cannot be parsed as a simple word-number.
-        """
-        s = normalize_text(s)
-        if not s:
-            return None
-        parts = s.split()
-        total = 0
-        i = 0
-        while i < len(parts):
-            w = parts[i]
-            if w in _WORD_NUMS:
-                val = _WORD_NUMS[w]
-                # handle constructs like "twenty one"
-                if (
-                    val >= 20
-                    and i + 1 < len(parts)
-                    and parts[i + 1] in _WORD_NUMS
-                    and _WORD_NUMS[parts[i + 1]] < 10
-                ):
-                    total += val + _WORD_NUMS[parts[i + 1]]
-                    i += 2
-                    continue
-                total += val
-                i += 1
-            else:
-                return None
-        return total
-
-    def is_numeric(s: str) -> Optional[float]:
-        """Try to interpret a string as a numeric value.
-
-        Accepts plain digits (including floats) and small spelled-out numbers.
-        """
-        s_norm = normalize_text(s)
-        if not s_norm:
-            return None
-        try:
-            return float(s_norm)
-        except ValueError:
-            pass
-        wn = word_number_to_int(s_norm)
-        if wn is not None:
-            return float(wn)
+def is_numeric(s: str) -> Optional[float]:
+    """Try to interpret a string as a numeric value.
+
+    Accepts plain digits (including floats) and small spelled-out numbers.
+    """
+    s_norm = normalize_text(s)
+    if not s_norm:
         return None
+    try:
+        return float(s_norm)
+    except ValueError:
+        pass
+    wn = word_number_to_int(s_norm)
+    if wn is not None:
+        return float(wn)
+    return None
 
-    def _fuzzy_ratio(a: str, b: str) -> float:
-        """Return a similarity score between 0 and 100 for two strings.
-
-        Prefer rapidfuzz.token_sort_ratio when available; otherwise fall back
-        to difflib's SequenceMatcher scaled to 0..100.
-        """
-        try:
-            if (
-                _HAS_RAPIDFUZZ
-                and fuzz is not None
-                and hasattr(fuzz, "token_sort_ratio")
-            ):
-                score = fuzz.token_sort_ratio(a, b)
-                return float(score)
-        except Exception:
-            # If rapidfuzz fails for any reason, we'll quietly fall back.
-            pass
-        return difflib.SequenceMatcher(None, a, b).ratio() * 100.0
-
-    # --- End local helpers ---
 
-    topic = question["topic"]
-    correct_answer = question["answer"]
+def _prepare_question(question):
+    """Pre-normalise a question's accepted answers and cache them on the dict.
 
+    The accepted answers never change during a session, so normalising them
+    once up front saves repeating the same work every time the question is
+    asked. Already-prepared questions are left untouched.
+    """
+    if "_answers_norm" in question:
+        return
+    correct_answer = question["answer"]
     # Accept either a single canonical answer or a list of acceptable answers
     # (useful to include synonyms, abbreviations or alternate phrasings).
     if isinstance(correct_answer, list):
-        correct_answers_raw = correct_answer
+        answers = correct_answer
     else:
-        correct_answers_raw = [correct_answer]
+        answers = [correct_answer]
+    question["_answers_raw"] = answers
+    question["_answers_norm"] = [normalize_text(a) for a in answers]
+    question["_answers_option"] = [normalize_option(a) for a in answers]
+    question["_answers_num"] = [is_numeric(a) for a in answers]
+    # Normalised and option forms of every accepted answer, mapped to the
+    # answer's index, so exact and option matches are one dict lookup. The
+    # first answer to produce a given form wins, as in the ordered loop.
+    accept_map = {}
+    for idx, (norm, option) in enumerate(
+        zip(question["_answers_norm"], question["_answers_option"])
+    ):
+        for form in (norm, option):
+            if form:
+                accept_map.setdefault(form, idx)
+    question["_accept_map"] = accept_map
+    question["_matcher"] = _build_matcher(question)
+
+
+def _build_matcher(question):
+    """Build a matching function specialised to one question's answers.
+
+    The accepted answers are fixed once a question is prepared, so everything
+    each matching step needs is bound into the returned closure up front and
+    steps that can never succeed (e.g. numeric matching when no answer is a
+    number) are skipped outright.
+
+    The matcher takes the student's normalised answer, option token and
+    numeric value, and returns the index of the accepted answer that matched
+    or None.
+    """
+    accept_map = question["_accept_map"]
+    norms = [(idx, n) for idx, n in enumerate(question["_answers_norm"]) if n]
+    numbers = [
+        (idx, n) for idx, n in enumerate(question["_answers_num"]) if n is not None
+    ]
+    fuzzy_choices = [n for _, n in norms]
+
+    def match(user_norm, user_option, ua_num):
+        # 1) exact normalized match (case / punctuation removed) and
+        # 2) option letter/number equivalence for multiple-choice style answers
+        idx = accept_map.get(user_norm)
+        if idx is None:
+            idx = accept_map.get(user_option)
+        if idx is not None:
+            return idx
 
-    user_answer_raw = input("\n" + question["question"] + " ")
-    user_norm = normalize_text(user_answer_raw)
-    user_option = normalize_option(user_answer_raw)
+        # 3) numeric matching: allow 'three' <-> '3' comparisons
+        if numbers and ua_num is not None:
+            for idx, ca_num in numbers:
+                if abs(ua_num - ca_num) < 1e-9:
+                    return idx
 
-    # Ensure the performance tracking structure exists for this topic.
-    if topic not in performance[key]:
-        performance[key][topic] = {"attempted": 0, "correct": 0}
+        # 4) containment: allow short correct tokens inside a longer reply
+        for idx, ca_norm in norms:
+            if ca_norm in user_norm:
+                return idx
+
+        # 5) conservative fuzzy match to catch minor typos / small differences
+        # using rapidfuzz's plain Indel ratio (answers are short, so sorting
+        # tokens first only adds overhead). extractOne scores every candidate
+        # in C++ and uses score_cutoff to skip pairs whose lengths alone rule
+        # out a match.
+        if user_norm and fuzzy_choices:
+            best = process.extractOne(
+                user_norm,
+                fuzzy_choices,
+                scorer=fuzz.ratio,
+                score_cutoff=FUZZY_THRESHOLD,
+            )
+            if best is not None:
+                return norms[best[2]][0]
 
-    performance[key][topic]["attempted"] += 1
+        return None
 
-    accepted = False
-    matched = None
-    fuzzy_threshold = 88.0  # conservative default for short answers
+    return match
 
-    for ca_raw in correct_answers_raw:
-        ca_norm = normalize_text(ca_raw)
-        ca_option = normalize_option(ca_raw)
 
-        # 1) exact normalized match (case / punctuation removed)
-        if user_norm and ca_norm and user_norm == ca_norm:
-            accepted = True
-            matched = ca_raw
-            break
+# -------------------------------
+# Quiz logic and answer matching
+# -------------------------------
+def ask_question(question, performance, key):
+    """Ask a single question, accept flexible answers and update performance.
 
-        # 2) option letter/number equivalence for multiple-choice style answers
-        if user_option and ca_option and user_option == ca_option:
-            accepted = True
-            matched = ca_raw
-            break
+    The matching logic is intentionally forgiving to make revision sessions
+    smoother for students: it normalises case and punctuation, accepts small
+    word-number variants (e.g. 'three' vs '3'), handles option letters
+    ('A', 'a)') and applies a conservative fuzzy-match threshold for minor
+    typos or spelling differences.
 
-        # 3) numeric matching: allow 'three' <-> '3' comparisons
-        ua_num = is_numeric(user_answer_raw)
-        ca_num = is_numeric(ca_raw)
-        if ua_num is not None and ca_num is not None:
-            if abs(ua_num - ca_num) < 1e-9:
-                accepted = True
-                matched = ca_raw
-                break
-
-        # 4) containment: allow short correct tokens inside a longer student reply
-        if ca_norm and ca_norm in user_norm:
-            accepted = True
-            matched = ca_raw
-            break
+    The question must have been passed through _prepare_question first so
+    its accepted answers are already normalised.
+    """
+    topic = question["topic"]
+    correct_answers_raw = question["_answers_raw"]
 
-        # 5) conservative fuzzy match to catch minor typos / small differences
-        if ca_norm and user_norm:
-            score = _fuzzy_ratio(user_norm, ca_norm)
-            if score >= fuzzy_threshold:
-                accepted = True
-                matched = ca_raw
-                break
+    user_answer_raw = input("\n" + question["question"] + " ")
+    user_norm = normalize_text(user_answer_raw)
+    user_option = normalize_option(user_answer_raw)
+    ua_num = is_numeric(user_answer_raw)
+
+    # Ensure the performance tracking structure exists for this topic.
+    if topic not in performance[key]:
+        performance[key][topic] = Stats()
+
+    performance[key][topic].attempted += 1
+
+    # The matcher was specialised to this question by _prepare_question.
+    idx = question["_matcher"](user_norm, user_option, ua_num)
+    accepted = idx is not None
+    matched = correct_answers_raw[idx] if accepted else None
 
     if accepted:
         # Friendly feedback that shows which stored answer was accepted. This
@@ -369,7 +559,7 @@ def ask_question(question, performance, key):
             print(f"✅ Correct! (accepted: {matched})\n")
         else:
             print("✅ Correct!\n")
-        performance[key][topic]["correct"] += 1
+        performance[key][topic].correct += 1
     else:
         # When marking incorrect, display the canonical accepted answers so the
         # learner can see what was expected and learn from the feedback.
@@ -399,7 +589,7 @@ def view_performance(performance):
         for topic, stats in topics.items():
             accuracy = get_accuracy(stats) * 100
             print(
-                f"  {topic}: {accuracy:.1f}% correct ({stats['correct']}/{stats['attempted']})"
+                f"  {topic}: {accuracy:.1f}% correct ({stats.correct}/{stats.attempted})"
             )
     print("\nEnd of performance data.\n")
     input("Press Enter to return to main menu...")
@@ -415,7 +605,7 @@ def main_menu():
     understand and mark for A-Level coursework. It guides the student through
     choosing qualification level, subject and running a quiz session.
     """
-    performance = load_performance()
+    performance = performance_store.get()
 
     while True:
         clear_screen()
@@ -458,18 +648,22 @@ def start_quiz(performance):
     if key not in performance:
         performance[key] = {}
 
-    questions = load_questions(level, subject)
-    if not questions:
+    questions = iter_questions(level, subject)
+    first = next(questions, None)
+    if first is None:
         print("No questions found for this subject/level. Returning to main menu.\n")
         input("Press Enter to continue...")
         return
 
     print(f"\nStarting quiz: {level} {subject.replace('_', ' ')}\n")
 
-    for question in questions:
+    for question in itertools.chain([first], questions):
+        # Normalise the accepted answers once, before the question is asked.
+        _prepare_question(question)
         ask_question(question, performance, key)
+        performance_store.mark_dirty()
 
-    save_performance(performance)
+    performance_store.flush()
     print("\n--- Session Summary ---")
     show_summary(performance[key])
     input("\nPress Enter to return to main menu...")
@@ -480,7 +674,7 @@ def show_summary(data):
     for topic, stats in data.items():
         accuracy = get_accuracy(stats) * 100
         print(
-            f"{topic}: {accuracy:.1f}% correct ({stats['correct']}/{stats['attempted']})"
+            f"{topic}: {accuracy:.1f}% correct ({stats.correct}/{stats.attempted})"
         )
 
 